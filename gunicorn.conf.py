@@ -0,0 +1,58 @@
+# Gunicorn settings for the food ordering app
+#
+# GUNICORN_WORKER_CLASS picks the serving mode:
+#   gevent  - (default) a few workers, each serving many requests on greenlets;
+#             held SSE streams and slow Postgres calls only park a greenlet
+#   gthread - a thread pool per worker, for hosts where gevent is unavailable
+#   sync    - the old one-request-per-worker model
+# WEB_CONCURRENCY and GUNICORN_THREADS override the CPU-based sizing.
+# `flask --app app serve-benchmark` reruns the load comparison behind the
+# gevent default against each worker class.
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+
+cores = multiprocessing.cpu_count()
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gevent')
+
+if worker_class == 'gevent':
+    # One process per core; concurrency comes from greenlets, not processes
+    default_workers = cores
+    worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 500))
+elif worker_class == 'gthread':
+    default_workers = cores + 1
+    threads = int(os.environ.get('GUNICORN_THREADS', 4))
+else:
+    default_workers = cores * 2 + 1
+
+workers = int(os.environ.get('WEB_CONCURRENCY', default_workers))
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+keepalive = 5
+accesslog = '-'
+
+# Workers write Prometheus samples here so /metrics can merge them. It must
+# be set before the app (and prometheus_client) is imported in a worker
+metrics_dir = os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR',
+                                    os.path.join(tempfile.gettempdir(), 'kilimanjaro-metrics'))
+
+
+def on_starting(server):
+    # Samples from a previous run would be merged into the new totals
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+
+
+def post_fork(server, worker):
+    if worker_class == 'gevent':
+        # psycopg2 blocks in C; route its socket waits through the gevent hub
+        from psycogreen.gevent import patch_psycopg
+        patch_psycopg()
+        server.log.info("Worker %s: psycopg2 patched for gevent", worker.pid)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)